@@ -1,37 +1,65 @@
 """
 Utility functions for saving election results to CSV files.
 
-Provides a helper to write a list of dictionaries to a CSV file with
-specified headers.
+Provides a helper to write rows to a CSV file with specified
+headers.
 """
 
+from collections.abc import Iterable
 from pathlib import Path
 import csv
 
+import requests
 
-def save_csv(data: list[dict], headers: list[str], filename: str) -> None:
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def save_csv(
+        data: Iterable[tuple],
+        headers: list[str],
+        filename: str
+) -> None:
     """
-    Save a list of dictionaries to a CSV file with specified headers.
+    Save rows to a CSV file with specified headers.
+
+    Rows are consumed lazily, so a generator is written out as it
+    produces them without holding all rows in memory. They go to a
+    temporary file that replaces the target only once all rows are
+    written, so a failure leaves any existing file untouched.
 
     Args:
-        data (list[dict]): List of result rows, each as a dictionary.
+        data (Iterable[tuple]): Result rows, each as a tuple ordered
+            like headers.
         headers (list[str]): List of CSV column headers.
         filename (str): Output CSV filename. Extension will be forced
             to .csv.
 
     Raises:
         RuntimeError: If file writing fails due to OS or CSV error.
+        requests.RequestException: If fetching a row from data fails.
     """
     p = Path(filename)
     root = p.stem
     name = f'{root}.csv'
+    tmp_path = Path(f'{name}.tmp')
     try:
-        with open(name, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, headers)
-            writer.writeheader()
+        with open(
+            tmp_path,
+            'w',
+            buffering=WRITE_BUFFER_SIZE,
+            newline='',
+            encoding='utf-8'
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
             writer.writerows(data)
+        tmp_path.replace(name)
         print(f'File {name} exported.')
+    except requests.RequestException:
+        raise
     except (OSError, csv.Error) as e:
         raise RuntimeError(
             f'Error writing CSV file {name}: {e}'
         ) from e
+    finally:
+        tmp_path.unlink(missing_ok=True)
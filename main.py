@@ -9,8 +9,7 @@ import sys
 from csv_utils import save_csv
 from scraper_utils import (
     request_data,
-    extract_data,
-    extract_links,
+    extract_main_listing,
     process_election_results
 )
 
@@ -19,8 +18,10 @@ DISTRICT_NAME_LOCATOR = ('td', {'class': 'overflow_name'})
 REG_VOTERS_LOCATOR = ('td', {'class': 'cislo', 'headers': 'sa2'})
 ISSUED_ENVELOPES_LOCATOR = ('td', {'class': 'cislo', 'headers': 'sa3'})
 VALID_VOTES_LOCATOR = ('td', {'class': 'cislo', 'headers': 'sa6'})
-VOTES_T1_LOCATOR = ('td', {'class': 'cislo', 'headers': 't1sa2 t1sb3'})
-VOTES_T2_LOCATOR = ('td', {'class': 'cislo', 'headers': 't2sa2 t2sb3'})
+VOTES_LOCATOR = (
+    'td',
+    {'class': 'cislo', 'headers': ['t1sa2 t1sb3', 't2sa2 t2sb3']}
+)
 PARTY_NAME_LOCATOR = ('td', {'class': 'overflow_name'})
 CSV_HEADERS = [
     'Kód',
@@ -57,8 +58,7 @@ def main(
     registered_voters_locator: tuple[str, dict],
     envelopes_issued_locator: tuple[str, dict],
     valid_votes_locator: tuple[str, dict],
-    votes_table1_locator: tuple[str, dict],
-    votes_table2_locator: tuple[str, dict],
+    votes_locator: tuple[str, dict],
     party_name_locator: tuple[str, dict],
     csv_headers: list[str]
 ) -> None:
@@ -78,10 +78,8 @@ def main(
             Locator for issued envelopes.
         valid_votes_locator (tuple[str, dict]):
             Locator for valid votes.
-        votes_table1_locator (tuple[str, dict]):
-            Locator for first vote table.
-        votes_table2_locator (tuple[str, dict]):
-            Locator for second vote table.
+        votes_locator (tuple[str, dict]):
+            Locator for party votes in both vote tables.
         party_name_locator (tuple[str, dict]): Locator for party names.
         csv_headers (list[str]): List of CSV column headers.
 
@@ -94,9 +92,9 @@ def main(
 
     print(f'Connecting to {url}')
     soup = request_data(url)
-    district_codes = extract_data(soup, district_code_locator)
-    district_names = extract_data(soup, district_name_locator)
-    district_links = extract_links(soup, url, district_code_locator)
+    district_codes, district_names, district_links = extract_main_listing(
+        soup, url, district_code_locator, district_name_locator
+    )
     if not (district_codes and district_names and district_links):
         raise ValueError('Failed to extract district codes, names, or links.')
 
@@ -104,8 +102,7 @@ def main(
     print('Processing data...')
     final_results, all_fieldnames = process_election_results(
         district_links,
-        votes_table1_locator,
-        votes_table2_locator,
+        votes_locator,
         registered_voters_locator,
         envelopes_issued_locator,
         valid_votes_locator,
@@ -114,9 +111,6 @@ def main(
         district_codes,
         district_names
     )
-    if not final_results:
-        raise ValueError('No results to save.')
-
     save_csv(final_results, all_fieldnames, csv_filename)
 
 
@@ -136,8 +130,7 @@ if __name__ == '__main__':
         REG_VOTERS_LOCATOR,
         ISSUED_ENVELOPES_LOCATOR,
         VALID_VOTES_LOCATOR,
-        VOTES_T1_LOCATOR,
-        VOTES_T2_LOCATOR,
+        VOTES_LOCATOR,
         PARTY_NAME_LOCATOR,
         CSV_HEADERS
     )
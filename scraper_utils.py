@@ -4,19 +4,111 @@ Provides helpers for requesting, extracting, and processing
 election results.
 """
 
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
+import os
+import re
+import threading
+import time
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup as bs
+import requests_cache
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup as bs, SoupStrainer
 from bs4.element import Tag
 
+MAX_WORKERS = 20
+MAX_INFLIGHT = MAX_WORKERS
+MIN_REQUEST_INTERVAL = 0.05
+CACHE_NAME = 'volby_cache'
+CACHE_EXPIRE_AFTER = 24 * 60 * 60
+USE_CACHE = not os.environ.get('ELECTION_SCRAPER_NO_CACHE')
+DETAIL_STRAINER = SoupStrainer('td', {'class': ['cislo', 'overflow_name']})
+
+# No-break and thin spaces that can appear as thousands separators.
+_NBSP_TABLE = str.maketrans({'\xa0': ' ', '\u202f': ' ', '\u2009': ' '})
+# Hrefs naming a file in the current directory, e.g. 'ps311?xjazyk=CZ'.
+_RELATIVE_HREF = re.compile(r'[\w-][\w.-]*(?:[?#][^\s\x00-\x1f\x7f]*)?')
+
+_LIMITER = threading.Semaphore(MAX_INFLIGHT)
+_THROTTLE_LOCK = threading.Lock()
+_next_allowed = 0.0
+
+_CACHE: requests_cache.CachedSession | None = None
+if USE_CACHE:
+    _CACHE = requests_cache.CachedSession(
+        CACHE_NAME, expire_after=CACHE_EXPIRE_AFTER, cache_control=True
+    )
+_SESSION: requests.Session = (
+    _CACHE if _CACHE is not None else requests.Session()
+)
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+_SESSION.mount(
+    'https://', HTTPAdapter(pool_connections=4, pool_maxsize=32)
+)
+
+
+def _wait_for_turn() -> None:
+    """
+    Block until the next network request may be sent.
+
+    Each caller reserves the next free slot under a lock and then
+    sleeps outside it, so requests leave at least
+    MIN_REQUEST_INTERVAL seconds apart across all threads.
+    """
+    global _next_allowed
+    with _THROTTLE_LOCK:
+        now = time.monotonic()
+        delay = max(0.0, _next_allowed - now)
+        _next_allowed = max(now, _next_allowed) + MIN_REQUEST_INTERVAL
+    if delay:
+        time.sleep(delay)
+
+
+def _fresh_cached_response(url: str) -> requests.Response | None:
+    """
+    Return the cached response for a URL if it is still fresh.
+
+    The entry is read straight from the cache backend, and expired
+    entries count as missing, since getting them would send a new
+    request to the host.
+
+    Args:
+        url (str): The URL to look up.
+
+    Returns:
+        requests.Response | None: Fresh cached response, or None if
+            the page has to be downloaded.
+    """
+    if _CACHE is None:
+        return None
+    request = _CACHE.prepare_request(requests.Request('GET', url))
+    cached = _CACHE.cache.get_response(_CACHE.cache.create_key(request))
+    if cached is not None and not cached.is_expired:
+        return cached
+    return None
 
-def request_data(url: str) -> bs:
+
+def request_data(url: str, strainer: SoupStrainer | None = None) -> bs:
     """
     Get HTML content from a URL and return a BeautifulSoup object.
 
+    Requests go through a shared session so that connections to the
+    same host are kept alive and reused. Unless the
+    ELECTION_SCRAPER_NO_CACHE environment variable is set, responses
+    are cached on disk, so repeated runs skip the network. Cache
+    headers sent by the server take precedence over the
+    CACHE_EXPIRE_AFTER fallback. At most MAX_INFLIGHT requests run
+    at once, and any request not answered by a fresh cache entry is
+    spaced by MIN_REQUEST_INTERVAL seconds to stay polite to the host.
+
     Args:
         url (str): The URL to fetch.
+        strainer (SoupStrainer | None): Optional strainer limiting
+            which elements are parsed into the tree.
 
     Returns:
         BeautifulSoup: Parsed HTML content.
@@ -25,10 +117,13 @@ def request_data(url: str) -> bs:
         requests.RequestException: If the request fails.
     """
     try:
-        headers = {"User-Agent": "Mozilla/5.0"}
-        response = requests.get(url, headers=headers, timeout=30)
+        with _LIMITER:
+            response = _fresh_cached_response(url)
+            if response is None:
+                _wait_for_turn()
+                response = _SESSION.get(url, timeout=30)
         response.raise_for_status()
-        return bs(response.text, 'html.parser')
+        return bs(response.text, 'lxml', parse_only=strainer)
     except requests.RequestException as e:
         raise requests.RequestException(f'Request failed: {e}')
 
@@ -45,15 +140,143 @@ def extract_data(soup: bs, locator: tuple[str, dict]) -> list[str]:
     Returns:
         list[str]: List of extracted text values.
     """
-    elements = soup.find_all(*locator)
+    elements = soup.find_all(_matcher(locator))
     extracted_values = []
     for element in elements:
         extracted_values.append(
-            element.get_text(strip=True).replace('\xa0', ' ')
+            element.get_text(strip=True).translate(_NBSP_TABLE)
         )
     return extracted_values
 
 
+@lru_cache(maxsize=None)
+def _compile_matcher(
+        tag: str,
+        attrs: tuple[tuple[str, tuple[str, ...]], ...]
+) -> Callable[[Tag], bool]:
+    """
+    Build a predicate matching elements of a locator.
+
+    Multi-valued attributes such as class or headers match either a
+    single value or the whole space-separated string, and a list of
+    expected values matches any of them, as in find_all.
+
+    Args:
+        tag (str): Tag name to match.
+        attrs (tuple): Attribute names with their accepted values.
+
+    Returns:
+        Callable[[Tag], bool]: Predicate returning True for elements
+            matching the locator.
+    """
+    checks = [(name, frozenset(options)) for name, options in attrs]
+
+    def matcher(element: Tag) -> bool:
+        if element.name != tag:
+            return False
+        for name, options in checks:
+            value = element.get(name)
+            if value is None:
+                return False
+            if isinstance(value, list):
+                joined = ' '.join(value)
+                if options.isdisjoint(value) and joined not in options:
+                    return False
+            elif value not in options:
+                return False
+        return True
+
+    return matcher
+
+
+def _matcher(locator: tuple[str, dict]) -> Callable[[Tag], bool]:
+    """
+    Return the compiled predicate for a locator, built once per run.
+
+    Args:
+        locator (tuple[str, dict]): Tag and attribute dictionary
+            for selection.
+
+    Returns:
+        Callable[[Tag], bool]: Predicate matching the locator.
+    """
+    tag, attrs = locator
+    return _compile_matcher(tag, tuple(
+        (name, (value,) if isinstance(value, str) else tuple(value))
+        for name, value in attrs.items()
+    ))
+
+
+def extract_all(
+        soup: bs,
+        locators: dict[str, tuple[str, dict]]
+) -> dict[str, list[str]]:
+    """
+    Extract text content for several locators in a single tree pass.
+
+    Args:
+        soup (BeautifulSoup): Parsed HTML content.
+        locators (dict[str, tuple[str, dict]]): Locators keyed by
+            the name under which their values are returned.
+
+    Returns:
+        dict[str, list[str]]: Extracted text values per locator key,
+            in document order.
+    """
+    extracted_values: dict[str, list[str]] = {key: [] for key in locators}
+    matchers = [(key, _matcher(locator)) for key, locator in locators.items()]
+    tags = list({tag for tag, _ in locators.values()})
+    for element in soup.find_all(tags):
+        if not isinstance(element, Tag):
+            continue
+        text = None
+        for key, matcher in matchers:
+            if matcher(element):
+                if text is None:
+                    text = element.get_text(strip=True).translate(_NBSP_TABLE)
+                extracted_values[key].append(text)
+    return extracted_values
+
+
+def _base_url(url: str) -> str:
+    """
+    Return the directory part of a URL for joining relative links.
+
+    Args:
+        url (str): Page URL.
+
+    Returns:
+        str: Scheme, host and directory path ending with a slash.
+    """
+    parsed = urlparse(url)
+    base_path = parsed.path.rsplit('/', 1)[0]
+    return f"{parsed.scheme}://{parsed.netloc}{base_path}/"
+
+
+def _find_link(element: Tag, base_url: str) -> str | None:
+    """
+    Build a full URL from the first anchor inside an element.
+
+    Hrefs naming a file in the same directory are appended to
+    base_url directly; anything else goes through urljoin.
+
+    Args:
+        element (Tag): HTML element containing the anchor.
+        base_url (str): Base URL for joining relative links.
+
+    Returns:
+        str | None: Full URL, or None if there is no usable anchor.
+    """
+    link_tag = element.find('a')
+    if isinstance(link_tag, Tag):
+        href = link_tag.get('href')
+        if isinstance(href, str):
+            if _RELATIVE_HREF.fullmatch(href):
+                return base_url + href
+            return urljoin(base_url, href)
+    return None
+
+
 def extract_links(soup: bs, url: str, locator: tuple[str, dict]) -> list[str]:
     """
     Find and build full URLs from selected HTML elements.
@@ -67,22 +290,56 @@ def extract_links(soup: bs, url: str, locator: tuple[str, dict]) -> list[str]:
     Returns:
         list[str]: List of full URLs extracted from anchor tags.
     """
-    parsed = urlparse(url)
-    base_path = parsed.path.rsplit('/', 1)[0]
-    base_url = f"{parsed.scheme}://{parsed.netloc}{base_path}/"
-    elements = soup.find_all(*locator)
+    base_url = _base_url(url)
+    elements = soup.find_all(_matcher(locator))
     links = []
     for td in elements:
         if isinstance(td, Tag):
-            link_tag = td.find('a')
-            if isinstance(link_tag, Tag):
-                href = link_tag.get('href')
-                if isinstance(href, str):
-                    full_link = urljoin(base_url, href)
-                    links.append(full_link)
+            full_link = _find_link(td, base_url)
+            if full_link is not None:
+                links.append(full_link)
     return links
 
 
+def extract_main_listing(
+        soup: bs,
+        url: str,
+        code_locator: tuple[str, dict],
+        name_locator: tuple[str, dict]
+) -> tuple[list[str], list[str], list[str]]:
+    """
+    Extract district codes, names and detail links in one tree pass.
+
+    Args:
+        soup (BeautifulSoup): Parsed main listing page.
+        url (str): Base URL for joining relative links.
+        code_locator (tuple[str, dict]): Locator for district code
+            cells, which also hold the detail links.
+        name_locator (tuple[str, dict]): Locator for district names.
+
+    Returns:
+        tuple[list[str], list[str], list[str]]: District codes,
+            names and full URLs of their detail pages.
+    """
+    base_url = _base_url(url)
+    codes = []
+    names = []
+    links = []
+    is_code = _matcher(code_locator)
+    is_name = _matcher(name_locator)
+    for element in soup.find_all(list({code_locator[0], name_locator[0]})):
+        if not isinstance(element, Tag):
+            continue
+        if is_code(element):
+            codes.append(element.get_text(strip=True).translate(_NBSP_TABLE))
+            full_link = _find_link(element, base_url)
+            if full_link is not None:
+                links.append(full_link)
+        if is_name(element):
+            names.append(element.get_text(strip=True).translate(_NBSP_TABLE))
+    return codes, names, links
+
+
 def extract_csv_fieldnames(
         base_headers: list[str],
         soup: bs,
@@ -101,58 +358,137 @@ def extract_csv_fieldnames(
         list[str]: Extended list of CSV column headers including
             party names.
     """
-    extended_headers = base_headers.copy()
-    party_names = extract_data(soup, party_locator)
-    for name in party_names:
-        if name not in extended_headers:
-            extended_headers.append(name)
-    return extended_headers
+    seen = set(base_headers)
+    party_names = dict.fromkeys(extract_data(soup, party_locator))
+    return [
+        *base_headers,
+        *(name for name in party_names if name not in seen)
+    ]
+
+
+def parse_district_data(
+    soup: bs,
+    votes_locator: tuple[str, dict],
+    registered_voters_locator: tuple[str, dict],
+    envelopes_issued_locator: tuple[str, dict],
+    valid_votes_locator: tuple[str, dict]
+) -> tuple[list[str], str, str, str]:
+    """
+    Extract all relevant data for a district from its parsed page.
+
+    Args:
+        soup (BeautifulSoup): Parsed district detail page.
+        votes_locator: Locator for party votes in both vote tables.
+        registered_voters_locator, envelopes_issued_locator,
+            valid_votes_locator: Locators for summary fields.
+
+    Returns:
+        tuple: (party_votes, reg_voters, issued_envelopes,
+            valid_votes), with an empty string for a summary field
+            missing from the page.
+    """
+    values = extract_all(soup, {
+        'party_votes': votes_locator,
+        'reg_voters': registered_voters_locator,
+        'issued_envelopes': envelopes_issued_locator,
+        'valid_votes': valid_votes_locator
+    })
+    reg_voters = values['reg_voters']
+    issued_envelopes = values['issued_envelopes']
+    valid_votes = values['valid_votes']
+    return (
+        values['party_votes'],
+        reg_voters[0] if reg_voters else '',
+        issued_envelopes[0] if issued_envelopes else '',
+        valid_votes[0] if valid_votes else ''
+    )
 
 
 def extract_district_data(
     link: str,
-    votes_table1_locator: tuple[str, dict],
-    votes_table2_locator: tuple[str, dict],
+    votes_locator: tuple[str, dict],
     registered_voters_locator: tuple[str, dict],
     envelopes_issued_locator: tuple[str, dict],
-    valid_votes_locator: tuple[str, dict],
-    csv_headers: list[str],
-    party_name_locator: tuple[str, dict]
-) -> tuple[list[str], list[str], list[str], list[str], list[str]]:
+    valid_votes_locator: tuple[str, dict]
+) -> tuple[list[str], str, str, str]:
     """
-    Extract all relevant data for a district from its detail page.
+    Fetch a district detail page and extract its data.
 
     Args:
         link (str): URL to the district detail page.
-        votes_table1_locator, votes_table2_locator: Locators for
-            vote tables.
+        votes_locator: Locator for party votes in both vote tables.
         registered_voters_locator, envelopes_issued_locator,
             valid_votes_locator: Locators for summary fields.
-        csv_headers (list[str]): Base CSV headers.
-        party_name_locator: Locator for party names.
 
     Returns:
         tuple: (party_votes, reg_voters, issued_envelopes,
-            valid_votes, party_names)
+            valid_votes)
     """
-    soup = request_data(link)
-    party_votes =(
-        extract_data(soup, votes_table1_locator)
-        + extract_data(soup, votes_table2_locator)
+    soup = request_data(link, DETAIL_STRAINER)
+    return parse_district_data(
+        soup,
+        votes_locator,
+        registered_voters_locator,
+        envelopes_issued_locator,
+        valid_votes_locator
     )
-    reg_voters = extract_data(soup, registered_voters_locator)
-    issued_envelopes = extract_data(soup, envelopes_issued_locator)
-    valid_votes = extract_data(soup, valid_votes_locator)
-    party_names = extract_csv_fieldnames(
-        csv_headers, soup, party_name_locator
-    )
-    return party_votes, reg_voters, issued_envelopes, valid_votes, party_names
+
+
+def _iter_results(
+    district_links: list[str],
+    first_district: tuple[list[str], str, str, str],
+    fetch_district: Callable,
+    district_codes: list[str],
+    district_names: list[str],
+    party_count: int
+) -> Iterator[tuple]:
+    """
+    Yield one result row per district as its page is processed.
+
+    Rows are tuples ordered like the CSV fieldnames, with party
+    votes padded or cut to party_count columns. If a fetch fails or
+    the consumer stops early, district pages not yet started are
+    cancelled instead of being downloaded.
+
+    Args:
+        district_links (list[str]): List of URLs to district detail
+            pages.
+        first_district (tuple): Already extracted data of the first
+            district.
+        fetch_district (Callable): Function fetching and extracting
+            data for a single district link.
+        district_codes (list[str]): List of district codes.
+        district_names (list[str]): List of district names.
+        party_count (int): Number of party columns in the CSV.
+
+    Yields:
+        tuple: Result row of a single district.
+    """
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        district_data = chain(
+            [first_district],
+            executor.map(fetch_district, district_links[1:])
+        )
+        for link, code, name, district in zip(
+            district_links, district_codes, district_names, district_data
+        ):
+            party_votes, reg, envelopes, valid_votes = district
+            if not party_votes:
+                print(f'Warning: No party votes found for {link}')
+            missing = party_count - len(party_votes)
+            if missing > 0:
+                party_votes.extend([''] * missing)
+            elif missing < 0:
+                del party_votes[party_count:]
+            yield (code, name, reg, envelopes, valid_votes, *party_votes)
+    finally:
+        executor.shutdown(cancel_futures=True)
 
 
 def process_election_results(
     district_links: list[str],
-    votes_table1_locator: tuple[str, dict],
-    votes_table2_locator: tuple[str, dict],
+    votes_locator: tuple[str, dict],
     registered_voters_locator: tuple[str, dict],
     envelopes_issued_locator: tuple[str, dict],
     valid_votes_locator: tuple[str, dict],
@@ -160,18 +496,21 @@ def process_election_results(
     party_name_locator: tuple[str, dict],
     district_codes: list[str],
     district_names: list[str]
-) -> tuple[list[dict], list[str]]:
+) -> tuple[Iterator[tuple], list[str]]:
     """
     Process election results for all districts and return final
     results and fieldnames.
 
+    CSV fieldnames are taken from the first district page only.
+    The remaining pages are fetched concurrently by a pool of
+    MAX_WORKERS threads while the results are consumed; rows keep
+    the order of district_links.
+
     Args:
         district_links (list[str]): List of URLs to district detail
             pages.
-        votes_table1_locator (tuple[str, dict]): Locator for first
-            vote table.
-        votes_table2_locator (tuple[str, dict]): Locator for second
-            vote table.
+        votes_locator (tuple[str, dict]): Locator for party votes
+            in both vote tables.
         registered_voters_locator (tuple[str, dict]): Locator for
             registered voters field.
         envelopes_issued_locator (tuple[str, dict]): Locator for
@@ -185,64 +524,41 @@ def process_election_results(
         district_names (list[str]): List of district names.
 
     Returns:
-        tuple[list[dict], list[str]]: Final results as list of dicts
-            and CSV fieldnames.
+        tuple[Iterator[tuple], list[str]]: Lazy iterator over final
+            result rows in fieldname order and CSV fieldnames.
 
     Raises:
-        ValueError: If no CSV fieldnames are extracted.
-    """
-    party_vote_counts = []
-    all_fieldnames = []
-    reg_voters = []
-    issued_envelopes = []
-    valid_votes_count = []
-
-    for link in district_links:
-        party_votes, reg, envelopes, valid_votes, party_names = (
-            extract_district_data(
-            link,
-            votes_table1_locator,
-            votes_table2_locator,
-            registered_voters_locator,
-            envelopes_issued_locator,
-            valid_votes_locator,
-            csv_headers,
-            party_name_locator
-            )
-        )
-        if not party_votes:
-            print(f'Warning: No party votes found for {link}')
-        party_vote_counts.append(party_votes)
-        reg_voters += reg
-        issued_envelopes += envelopes
-        valid_votes_count += valid_votes
-        if not all_fieldnames:
-            all_fieldnames = party_names
-    if not all_fieldnames:
+        ValueError: If there are no district links to extract CSV
+            fieldnames from.
+    """
+    if not district_links:
         raise ValueError('No CSV fieldnames extracted.')
 
-    party_votes_dict = []
-    for vote_row in party_vote_counts:
-        vote_mapping = dict(zip(all_fieldnames[5:], vote_row))
-        party_votes_dict.append(vote_mapping)
+    first_soup = request_data(district_links[0], DETAIL_STRAINER)
+    all_fieldnames = extract_csv_fieldnames(
+        csv_headers, first_soup, party_name_locator
+    )
+    first_district = parse_district_data(
+        first_soup,
+        votes_locator,
+        registered_voters_locator,
+        envelopes_issued_locator,
+        valid_votes_locator
+    )
+    fetch_district = partial(
+        extract_district_data,
+        votes_locator=votes_locator,
+        registered_voters_locator=registered_voters_locator,
+        envelopes_issued_locator=envelopes_issued_locator,
+        valid_votes_locator=valid_votes_locator
+    )
 
-    final_results = []
-    for code, name, voters, envelopes, valid, party_votes in zip(
+    final_results = _iter_results(
+        district_links,
+        first_district,
+        fetch_district,
         district_codes,
         district_names,
-        reg_voters,
-        issued_envelopes,
-        valid_votes_count,
-        party_votes_dict
-    ):
-        row = {
-            'Kód': code,
-            'Obec': name,
-            'Voliči v seznamu': voters,
-            'Vydané obálky': envelopes,
-            'Platné hlasy': valid
-        }
-        row.update(party_votes)
-        final_results.append(row)
-
+        len(all_fieldnames) - len(csv_headers)
+    )
     return final_results, all_fieldnames